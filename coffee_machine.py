@@ -5,31 +5,17 @@ A comprehensive coffee machine simulation built using Object-Oriented Programmin
 This project demonstrates encapsulation, composition, and state management in Python.
 """
 
+import hashlib
+import hmac
+import sys
 import time
-class Drink:
-    """
-    Represents a coffee drink with its ingredients and pricing.
-    
-    This class encapsulates all drink-related data including required resources
-    and cost information. It serves as a blueprint for different coffee types.
-    """
-    
-    def __init__(self, name, water, milk, coffee, cost):
-        """
-        Initialize a new drink object.
-        
-        Args:
-            name (str): The name of the drink (e.g., 'Espresso', 'Latte')
-            water (int): Amount of water required in milliliters
-            milk (int): Amount of milk required in milliliters  
-            coffee (int): Amount of coffee required in grams
-            cost (int): Price of the drink in Pakistani Rupees
-        """
-        self.name = name
-        self.water = water
-        self.milk = milk
-        self.coffee = coffee
-        self.cost = cost
+from collections import deque, namedtuple
+
+# Represents a coffee drink with its ingredients and pricing.
+# A namedtuple keeps drink records immutable and lightweight: no per-instance
+# __dict__, and attribute access is a C-level offset load.
+# Fields: name (str), water (ml), milk (ml), coffee (g), cost (Rs)
+Drink = namedtuple('Drink', ['name', 'water', 'milk', 'coffee', 'cost'])
 
 
 class Order:
@@ -39,19 +25,24 @@ class Order:
     This class captures order information for record-keeping and history tracking.
     Each order contains drink details, payment amount, and timestamp.
     """
-    
+
+    # Fixed attribute set - avoids a per-instance __dict__ and keeps
+    # order records compact over a long-running session
+    __slots__ = ('drink_name', 'amount_paid', 'ts')
+
     def __init__(self, drink_name, amount_paid):
         """
         Initialize a new order record.
-        
+
         Args:
             drink_name (str): Name of the ordered drink
             amount_paid (int): Amount paid by customer
         """
         self.drink_name = drink_name
         self.amount_paid = amount_paid
-        # Generate timestamp in DD-MM-YYYY HH:MM:SS format
-        self.timestamp = time.strftime("%d-%m-%Y %H:%M:%S")
+        # Store the raw epoch time; formatting is deferred to display
+        # since most orders scroll out of the 5-entry history unseen
+        self.ts = time.time()
 
 
 class CoffeeMachine:
@@ -74,25 +65,74 @@ class CoffeeMachine:
         tracking variables for sales and order history.
         """
         # Initial resource levels - can be refilled by maintenance
-        self.resources = {
-            'water': 1000,     # in milliliters
-            'milk': 800,       # in milliliters  
-            'coffee': 300      # in grams
-        }
+        # Stored as plain attributes so the hot path (check_resources/make_drink)
+        # avoids a dict lookup per resource access
+        self.water = 1000      # in milliliters
+        self.milk = 800        # in milliliters
+        self.coffee = 300      # in grams
         
         # Menu dictionary containing all available drinks
         # Each drink is instantiated with specific resource requirements
+        # Keys are interned so lookups against interned user input hit the
+        # pointer-equality fast path in the dict comparator
         self.menu = {
-            'espresso': Drink('Espresso', 50, 0, 18, 100),        # Strong, no milk
-            'latte': Drink('Latte', 200, 150, 24, 200),           # Milky, smooth
-            'cappuccino': Drink('Cappuccino', 250, 100, 24, 250)  # Balanced, foamy
+            sys.intern('espresso'): Drink('Espresso', 50, 0, 18, 100),        # Strong, no milk
+            sys.intern('latte'): Drink('Latte', 200, 150, 24, 200),           # Milky, smooth
+            sys.intern('cappuccino'): Drink('Cappuccino', 250, 100, 24, 250)  # Balanced, foamy
         }
         
         # Financial tracking
         self.money_collected = 0  # Total revenue in Pakistani Rupees
+
+        # Admin password stored as a SHA-256 digest, precomputed once so
+        # authentication never handles the plaintext credential
+        self._pw_hash = hashlib.sha256(b"gcuadmin").digest()
+
+        # Per-resource worst-case requirement across the menu. While every
+        # resource is at or above its threshold, any drink can be made and
+        # check_resources can skip its per-ingredient comparisons
+        self._safe_water = max(d.water for d in self.menu.values())
+        self._safe_milk = max(d.milk for d in self.menu.values())
+        self._safe_coffee = max(d.coffee for d in self.menu.values())
+        self._all_safe = (self.water >= self._safe_water and
+                          self.milk >= self._safe_milk and
+                          self.coffee >= self._safe_coffee)
         
         # Order history for customer service and analytics
-        self.orders = []  # List to store Order objects
+        # Bounded deque keeps memory constant on a long-running kiosk;
+        # only the last 5 orders are ever displayed
+        self.orders = deque(maxlen=5)
+        self.total_orders = 0  # Lifetime order count for reporting
+
+        # Cached report text, reused while machine state is unchanged
+        self._report_cache = None
+        self._report_key = None
+
+        # Command dispatch table - one dict lookup in the main loop
+        # replaces a chain of string equality checks
+        self._commands = {
+            sys.intern('exit'): self._cmd_exit,
+            sys.intern('report'): self._cmd_report,
+            sys.intern('history'): self.show_order_history
+        }
+
+    @property
+    def resources(self):
+        """
+        Build the resource inventory dictionary on demand.
+
+        Returns:
+            dict: Current water, milk, and coffee levels
+
+        Kept as a property so code that consumes the report-style dict
+        (e.g. maintenance tooling) keeps working after resources moved
+        to plain attributes.
+        """
+        return {
+            'water': self.water,
+            'milk': self.milk,
+            'coffee': self.coffee
+        }
 
     def print_report(self):
         """
@@ -100,14 +140,25 @@ class CoffeeMachine:
         
         Shows current resource levels, total sales, and order statistics.
         This method is protected by password authentication for security.
+
+        The formatted report is cached and reused until machine state
+        changes, so repeated report requests skip the string building.
         """
-        print("\n📊 GCU Coffee Machine Report:")
-        print(f"Water: {self.resources['water']}ml")
-        print(f"Milk: {self.resources['milk']}ml") 
-        print(f"Coffee: {self.resources['coffee']}g")
-        print(f"Total Sales: Rs {self.money_collected}")
-        print("🧾 Total Orders:", len(self.orders))
-        print()
+        key = (self.water, self.milk, self.coffee,
+               self.money_collected, self.total_orders)
+        if key != self._report_key:
+            # State changed since the last report - rebuild and cache
+            self._report_cache = '\n'.join((
+                "\n📊 GCU Coffee Machine Report:",
+                f"Water: {self.water}ml",
+                f"Milk: {self.milk}ml",
+                f"Coffee: {self.coffee}g",
+                f"Total Sales: Rs {self.money_collected}",
+                f"🧾 Total Orders: {self.total_orders}",
+            ))
+            self._report_key = key
+        # Single write avoids one lock acquire + flush per line
+        sys.stdout.write(self._report_cache + '\n\n')
 
     def check_resources(self, drink):
         """
@@ -122,14 +173,19 @@ class CoffeeMachine:
         This method implements resource validation logic and provides
         user-friendly error messages for insufficient ingredients.
         """
+        # Fast path: while inventory covers the most demanding drink on
+        # the menu, any order is guaranteed to succeed
+        if self._all_safe:
+            return True
+
         # Check each resource requirement against current availability
-        if self.resources['water'] < drink.water:
+        if self.water < drink.water:
             print("❌ Not enough water.")
             return False
-        if self.resources['milk'] < drink.milk:
+        if self.milk < drink.milk:
             print("❌ Not enough milk.")
             return False
-        if self.resources['coffee'] < drink.coffee:
+        if self.coffee < drink.coffee:
             print("❌ Not enough coffee.")
             return False
         return True
@@ -148,15 +204,21 @@ class CoffeeMachine:
         4. Provides confirmation to customer
         """
         # Deduct resources used in drink preparation
-        self.resources['water'] -= drink.water
-        self.resources['milk'] -= drink.milk
-        self.resources['coffee'] -= drink.coffee
+        self.water -= drink.water
+        self.milk -= drink.milk
+        self.coffee -= drink.coffee
+
+        # Revalidate the check_resources fast path against the new levels
+        self._all_safe = (self.water >= self._safe_water and
+                          self.milk >= self._safe_milk and
+                          self.coffee >= self._safe_coffee)
         
         # Update financial records
         self.money_collected += drink.cost
         
         # Create and store order record for tracking
         self.orders.append(Order(drink.name, drink.cost))
+        self.total_orders += 1
         
         # Provide customer confirmation with friendly message
         print(f"✅ Here's your {drink.name}! Enjoy ☕\n")
@@ -173,11 +235,42 @@ class CoffeeMachine:
             print("📭 No orders placed yet.\n")
             return
             
-        print("📜 Order History (Last 5 orders):")
-        # Display only the most recent 5 orders using list slicing
-        for order in self.orders[-5:]:
-            print(f"{order.timestamp} - {order.drink_name} - Rs {order.amount_paid}")
-        print()
+        # The deque's maxlen already keeps only the most recent 5 orders;
+        # timestamps are formatted here, on demand, in DD-MM-YYYY HH:MM:SS.
+        # One write for the whole listing amortizes the per-print
+        # stdout lock and flush overhead
+        lines = ["📜 Order History (Last 5 orders):"]
+        lines.extend(
+            f"{time.strftime('%d-%m-%Y %H:%M:%S', time.localtime(order.ts))}"
+            f" - {order.drink_name} - Rs {order.amount_paid}"
+            for order in self.orders
+        )
+        sys.stdout.write('\n'.join(lines) + '\n\n')
+
+    def _cmd_exit(self):
+        """
+        Handle the 'exit' command from the main loop.
+
+        Returns:
+            bool: False to signal the main loop to terminate
+        """
+        print("👋 Thank you for visiting GCU Coffee Machine!")
+        return False
+
+    def _cmd_report(self):
+        """
+        Handle the 'report' command with password authentication.
+
+        Prompts for the admin password and displays the machine report
+        only when authentication succeeds.
+        """
+        password = input("🔐 Enter admin password: ")
+        # Constant-time compare against the precomputed digest avoids
+        # leaking password length or prefix through timing
+        if hmac.compare_digest(hashlib.sha256(password.encode()).digest(), self._pw_hash):
+            self.print_report()
+        else:
+            print("❌ Access denied.\n")
 
     def run(self):
         """
@@ -191,63 +284,68 @@ class CoffeeMachine:
         - Manages application lifecycle (start/exit)
         """
         print("👋 Welcome to GCU Coffee Machine!\n")
-        
+
+        # Bind hot-loop lookups to locals so each iteration uses a fast
+        # local load instead of attribute/global resolution
+        menu_get = self.menu.get
+        commands_get = self._commands.get
+        check = self.check_resources
+        make = self.make_drink
+        intern = sys.intern
+        _input = input
+        _print = print
+
         # Main interaction loop - continues until user exits
         while True:
             # Get user choice with clear instructions
-            choice = input("Enter drink name (espresso/latte/cappuccino), 'report', 'history', or 'exit': ").lower()
-
-            # Handle application exit
-            if choice == 'exit':
-                print("👋 Thank you for visiting GCU Coffee Machine!")
-                break
-                
-            # Handle admin report access with security
-            elif choice == 'report':
-                password = input("🔐 Enter admin password: ")
-                # Simple password authentication (in production, use hashed passwords)
-                if password == "gcuadmin":
-                    self.print_report()
-                else:
-                    print("❌ Access denied.\n")
-                    
-            # Handle order history display
-            elif choice == 'history':
-                self.show_order_history()
-                
-            # Handle drink orders
-            elif choice in self.menu:
-                drink = self.menu[choice]  # Get drink object from menu
-                
+            raw = _input("Enter drink name (espresso/latte/cappuccino), 'report', 'history', or 'exit': ").strip()
+            # Skip the .lower() allocation when the input is already
+            # lowercase, which is the usual case at the kiosk
+            choice = raw if raw.islower() else raw.lower()
+            # Intern the normalized input so menu/command lookups can
+            # short-circuit on pointer equality against the interned keys
+            choice = intern(choice)
+
+            # Drink orders are the common case, so check the menu first;
+            # commands go through the dispatch table built in __init__
+            drink = menu_get(choice)  # One lookup: membership + fetch
+            if drink is not None:
+
                 # Verify sufficient resources before processing order
-                if self.check_resources(drink):
-                    print(f"💰 Please pay Rs {drink.cost}")
-                    
+                if check(drink):
+                    _print(f"💰 Please pay Rs {drink.cost}")
+
                     # Payment processing with error handling
                     try:
-                        amount = int(input("Enter amount: Rs "))
+                        amount = int(_input("Enter amount: Rs "))
                     except ValueError:
                         # Handle non-numeric input gracefully
-                        print("❌ Invalid input. Please enter a number.\n")
+                        _print("❌ Invalid input. Please enter a number.\n")
                         continue
-                    
+
                     # Process payment and calculate change
                     if amount >= drink.cost:
                         change = amount - drink.cost
-                        
+
                         # Return change if overpaid
                         if change > 0:
-                            print(f"💸 Here is your change: Rs {change}")
-                            
+                            _print(f"💸 Here is your change: Rs {change}")
+
                         # Complete the order
-                        self.make_drink(drink)
+                        make(drink)
                     else:
                         # Handle insufficient payment
-                        print("❌ Not enough money. Money refunded.\n")
-                        
-            # Handle invalid menu options
+                        _print("❌ Not enough money. Money refunded.\n")
+
             else:
-                print("⚠️ Invalid option. Try again.\n")
+                # Route commands (exit/report/history) through the
+                # dispatch table; a handler returning False ends the loop
+                handler = commands_get(choice)
+                if handler is None:
+                    # Handle invalid menu options
+                    _print("⚠️ Invalid option. Try again.\n")
+                elif handler() is False:
+                    break
 
 
 # Application entry point - ensures code runs only when script is executed directly